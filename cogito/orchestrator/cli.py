@@ -38,9 +38,12 @@ Flags:
     --from-node   When resuming, jump to a specific node name
     --reader-model     Ollama model for analysis / planning
     --dramaturg-model  Ollama model for script writing
+    --analyst-workers  Concurrent chunk extractions (default: 4)
+    --translate-workers  Concurrent translation requests (default: 4)
     --skip-research    Skip web research stage
     --skip-audio       Skip VOICEVOX audio synthesis
     --skip-translate   Skip Japanese translation
+    --no-cache         Ignore cached LLM responses (analyst, book guide, translation)
 """
 
 from __future__ import annotations
@@ -150,6 +153,9 @@ def _build_initial_state(args: argparse.Namespace, run_id: str) -> CogitoState:
         "synthesizer_model": getattr(args, "synthesizer_model", None) or args.reader_model,
         "dramaturg_model": args.dramaturg_model,
         "translator_model": args.translator_model,
+        "analyst_workers": getattr(args, "analyst_workers", 4),
+        "translate_workers": getattr(args, "translate_workers", 4),
+        "use_cache": not getattr(args, "no_cache", False),
         "work_description": work_description,
         "run_dir": str(run_dir),
         "run_id": run_id,
@@ -284,6 +290,10 @@ def main(argv: list[str] | None = None) -> None:
                         help="概念グラフ合成モデル (未指定なら --reader-model を使用)")
     parser.add_argument("--dramaturg-model", default="glm-4.7-flash:latest")
     parser.add_argument("--translator-model", default="translategemma:12b")
+    parser.add_argument("--analyst-workers", type=int, default=4,
+                        help="チャンク抽出の並列数 (OLLAMA_NUM_PARALLEL に合わせる, default: 4)")
+    parser.add_argument("--translate-workers", type=int, default=4,
+                        help="翻訳リクエストの並列数 (OLLAMA_NUM_PARALLEL に合わせる, default: 4)")
     # Flags
     parser.add_argument("--skip-research", action="store_true")
     parser.add_argument("--skip-translate", action="store_true")
@@ -291,6 +301,8 @@ def main(argv: list[str] | None = None) -> None:
     parser.add_argument("--skip-eval", action="store_true", help="スクリプト評価をスキップ")
     parser.add_argument("--eval-threshold", type=float, default=3.0,
                         help="再生成しきい値 (1-5, default: 3.0)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="data/cache/ のLLM応答キャッシュを使わず再生成する")
     # New book generation
     parser.add_argument(
         "--add-book",
@@ -311,6 +323,11 @@ def main(argv: list[str] | None = None) -> None:
         print(f"   実行: python -m cogito.orchestrator --book {output_path.stem}")
         return
 
+    if args.analyst_workers < 1:
+        parser.error("--analyst-workers must be at least 1")
+    if args.translate_workers < 1:
+        parser.error("--translate-workers must be at least 1")
+
     if not args.resume:
         if args.source == "web" and not args.book and not args.subject:
             parser.error("--source web requires either --book or --subject")
@@ -57,12 +57,15 @@ def node_analyze_chunks(state: CogitoState) -> dict:
     from cogito.services.analyst.extractor import extract_all_chunks
 
     key_terms = state.get("book_config", {}).get("context", {}).get("key_terms") or None
+    run_dir = Path(state["run_dir"])
     analyses, _log = extract_all_chunks(
         state["chunk_tuples"],
         model=state["reader_model"],
         key_terms=key_terms,
+        max_workers=state.get("analyst_workers", 4),
+        use_cache=state.get("use_cache", True),
+        stream_path=run_dir / "02_chunk_analyses.ndjson",
     )
-    run_dir = Path(state["run_dir"])
     (run_dir / "02_chunk_analyses.json").write_text(
         json.dumps(analyses, ensure_ascii=False, indent=2), encoding="utf-8"
     )
@@ -83,6 +86,7 @@ def node_synthesize_graph(state: CogitoState) -> dict:
         work_description=work_description,
         subject=work_description,
         model=state.get("synthesizer_model") or state["reader_model"],
+        use_cache=state.get("use_cache", True),
     )
     run_dir = Path(state["run_dir"])
     cg_path = run_dir / "03_concept_graph.json"
@@ -115,6 +119,7 @@ def node_web_research(state: CogitoState) -> dict:
         book=book_name,
         subject=work_description,
         author=author,
+        use_cache=state.get("use_cache", True),
     )
 
     steps = list(state.get("thinking_log", []))
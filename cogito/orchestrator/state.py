@@ -14,6 +14,9 @@ class CogitoState(TypedDict):
     synthesizer_model: str   # concept graph synthesis (defaults to reader_model)
     dramaturg_model: str     # script + essay writing
     translator_model: str
+    analyst_workers: int     # concurrent chunk extractions (match OLLAMA_NUM_PARALLEL)
+    translate_workers: int   # concurrent translation requests (match OLLAMA_NUM_PARALLEL)
+    use_cache: bool          # reuse cached LLM responses under data/cache/ (--no-cache)
     work_description: str
 
     # Run metadata (str because Path is not serialisable)
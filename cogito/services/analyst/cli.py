@@ -56,6 +56,8 @@ def run(
     output_path: Path,
     model: str = "llama3",
     book: str | None = None,
+    max_workers: int = 4,
+    use_cache: bool = True,
 ) -> ConceptGraphV1:
     """Programmatic entry point (importable from other modules)."""
 
@@ -78,7 +80,8 @@ def run(
     print(f"  Extracting concepts from {len(chunks_tuples)} chunks (model: {model}) ...",
           flush=True)
     chunk_analyses, extract_log = extract_all_chunks(
-        chunks_tuples, model=model, key_terms=key_terms or None
+        chunks_tuples, model=model, key_terms=key_terms or None,
+        max_workers=max_workers, use_cache=use_cache,
     )
 
     # ── Step 2: Synthesize concept graph ──────────────────────────────────────
@@ -89,6 +92,7 @@ def run(
         subject=subject,
         model=model,
         source_mode=chunks_v1.source_mode if chunks_v1.source_mode in ("book",) else "book",
+        use_cache=use_cache,
     )
 
     # ── Save output ───────────────────────────────────────────────────────────
@@ -128,13 +132,25 @@ def main(argv: list[str] | None = None) -> None:
         "--book", default=None, metavar="BOOK",
         help="Book config name to load key_terms / work_description (optional)",
     )
+    parser.add_argument(
+        "--max-workers", type=int, default=4, metavar="N",
+        help="Chunks extracted concurrently; match OLLAMA_NUM_PARALLEL (default: 4)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore cached LLM responses in data/cache/analyst* and re-run the LLM",
+    )
     args = parser.parse_args(argv)
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
 
     run(
         input_path=Path(args.input),
         output_path=Path(args.output),
         model=args.model,
         book=args.book,
+        max_workers=args.max_workers,
+        use_cache=not args.no_cache,
     )
 
 
@@ -9,18 +9,41 @@ Changes from the original:
 from __future__ import annotations
 
 import json
+import random
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 from langchain_ollama import ChatOllama
 
 from cogito.utils import event_log
 
+from cogito.utils.cache import cache_file, read_cached, write_cached
 from cogito.utils.logger import create_step, extract_json
 
 
 MAX_RETRIES = 3
 
+# Truncated exponential backoff between retries: base * 2**attempt seconds,
+# capped at RETRY_MAX_SECS, plus up to 1s of jitter so parallel workers that
+# failed together do not hit Ollama again in lockstep.
+RETRY_BASE_SECS = 5
+RETRY_MAX_SECS = 60
+
+# Characters of chunk text sent to the LLM. Slicing a str that is already
+# shorter than this returns the same object, so short chunks are not copied.
+MAX_CHUNK_CHARS = 20000
+
+# Above this many key_terms, each chunk's prompt lists only the terms that
+# literally occur in that chunk. Shorter lists are sent whole, since terms
+# like "Methodical Doubt" often name ideas the text never spells out.
+KEY_TERMS_FILTER_THRESHOLD = 12
+
+CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "analyst"
+
+# Bump when ANALYSIS_PROMPT or ANALYSIS_SCHEMA changes.
+CACHE_VERSION = 1
+
 
 ANALYSIS_PROMPT = """\
 You are a scholar performing deep analytical reading of a text.
@@ -88,6 +111,56 @@ TEXT CHUNK ({part_id}):
 """
 
 
+def _array_of(properties: dict, required: list[str]) -> dict:
+    return {
+        "type": "array",
+        "items": {"type": "object", "properties": properties, "required": required},
+    }
+
+
+_STR = {"type": "string"}
+_STR_LIST = {"type": "array", "items": _STR}
+
+# JSON schema mirroring the structure requested by ANALYSIS_PROMPT. Passed as
+# Ollama's `format` (structured outputs, Ollama >= 0.5) so the response is
+# constrained to parseable JSON of the right shape instead of merely "json".
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "concepts": _array_of(
+            {"id": _STR, "name": _STR, "description": _STR,
+             "original_quotes": _STR_LIST, "source_chunk": _STR},
+            ["id", "name", "description", "original_quotes"],
+        ),
+        "aporias": _array_of(
+            {"id": _STR, "question": _STR, "context": _STR,
+             "related_concepts": _STR_LIST},
+            ["id", "question", "context"],
+        ),
+        "relations": _array_of(
+            {"source": _STR, "target": _STR, "evidence": _STR,
+             "relation_type": {"enum": ["depends_on", "contradicts", "evolves_into"]}},
+            ["source", "target", "relation_type", "evidence"],
+        ),
+        "logic_flow": _STR,
+        "arguments": _array_of(
+            {"id": _STR, "premises": _STR_LIST, "conclusion": _STR,
+             "argument_type": {"enum": ["deductive", "inductive", "analogical"]},
+             "source_chunk": _STR},
+            ["id", "premises", "conclusion", "argument_type"],
+        ),
+        "rhetorical_strategies": _array_of(
+            {"id": _STR, "description": _STR, "original_quote": _STR,
+             "strategy_type": {"enum": ["metaphor", "analogy", "thought_experiment",
+                                        "appeal_to_authority"]},
+             "source_chunk": _STR},
+            ["id", "strategy_type", "description"],
+        ),
+    },
+    "required": ["concepts", "aporias", "relations", "logic_flow"],
+}
+
+
 def _invoke_with_retry(llm: ChatOllama, prompt: str, label: str,
                        max_retries: int = MAX_RETRIES) -> str:
     """Invoke LLM with retry logic to handle Ollama hangs."""
@@ -99,19 +172,41 @@ def _invoke_with_retry(llm: ChatOllama, prompt: str, label: str,
             return result
         except Exception as e:
             if attempt < max_retries - 1:
-                wait = 10 * (attempt + 1)
-                print(f" [timeout/error on attempt {attempt+1}, retrying in {wait}s: {e}]",
+                wait = min(RETRY_MAX_SECS, RETRY_BASE_SECS * 2 ** attempt)
+                wait += random.uniform(0, 1)
+                print(f" [timeout/error on attempt {attempt+1}, retrying in {wait:.1f}s: {e}]",
                       end="", flush=True)
                 time.sleep(wait)
             else:
                 raise
 
 
+def _key_terms_for_chunk(chunk_text: str, key_terms: list[str]) -> list[str]:
+    """Return the key_terms worth mentioning in this chunk's prompt."""
+    terms = list(dict.fromkeys(key_terms))
+    if len(terms) <= KEY_TERMS_FILTER_THRESHOLD:
+        return terms
+    # Each term is checked on its own so one nested in another ("Attention"
+    # inside "Multi-Head Attention") is still found.
+    lowered = chunk_text.lower()
+    return [t for t in terms if t.lower() in lowered]
+
+
+def _is_usable_analysis(raw_response: str) -> bool:
+    """True if the response parses to an analysis with a concepts list."""
+    try:
+        parsed = extract_json(raw_response)
+    except (json.JSONDecodeError, IndexError, ValueError):
+        return False
+    return isinstance(parsed, dict) and isinstance(parsed.get("concepts"), list)
+
+
 def extract_chunk(
     chunk_text: str,
     part_id: str,
     llm: ChatOllama,
     key_terms: list[str] | None = None,
+    use_cache: bool = True,
 ) -> tuple[dict, dict]:
     """Analyse a single text chunk.
 
@@ -120,27 +215,45 @@ def extract_chunk(
         part_id:    Identifier for the chunk (e.g. "PART IV").
         llm:        Configured ChatOllama instance.
         key_terms:  Optional list of expected concepts to look for.
+        use_cache:  Reuse a previously parsed response for the identical
+                    (model, prompt) from CACHE_DIR instead of calling the LLM.
+                    Entries that no longer parse are dropped and regenerated.
 
     Returns:
         (analysis_dict, step_log_dict) — pure data, no LangGraph state.
     """
+    text = chunk_text[:MAX_CHUNK_CHARS]
+    terms = _key_terms_for_chunk(text, key_terms) if key_terms else []
     key_terms_instruction = (
-        f"Look especially for these known terms/techniques: {', '.join(key_terms)}"
-        if key_terms else ""
+        f"Look especially for these known terms/techniques: {', '.join(terms)}"
+        if terms else ""
     )
 
     prompt = ANALYSIS_PROMPT.format(
         part_id=part_id,
-        text=chunk_text[:20000],
+        text=text,
         key_terms_instruction=key_terms_instruction,
     )
 
-    raw_response = _invoke_with_retry(llm, prompt, part_id)
+    # The prompt embeds chunk text, part_id and key_terms, so (model, prompt)
+    # identifies the call exactly.
+    cache_path = cache_file(CACHE_DIR, CACHE_VERSION, llm.model, prompt) if use_cache else None
+    raw_response = (
+        read_cached(cache_path, _is_usable_analysis) if cache_path is not None else None
+    )
+    cached = raw_response is not None
+    if cached:
+        event_log.step("analyst/extractor", f"{part_id}: cache hit")
+    else:
+        raw_response = _invoke_with_retry(llm, prompt, part_id)
 
     parsed: dict | None = None
     error: str | None = None
     try:
         parsed = extract_json(raw_response)
+        # Only complete analyses are worth replaying on the next run.
+        if cache_path is not None and not cached and isinstance(parsed.get("concepts"), list):
+            write_cached(cache_path, raw_response)
     except (json.JSONDecodeError, IndexError, ValueError) as e:
         error = f"JSON parse error: {e}"
         parsed = {
@@ -154,7 +267,10 @@ def extract_chunk(
         layer="analyst",
         node="extractor",
         action=f"extract_chunk:{part_id}",
-        input_summary=f"Chunk '{part_id}': {len(chunk_text)} chars",
+        input_summary=(
+            f"Chunk '{part_id}': {len(chunk_text)} chars"
+            + (f" (truncated to {MAX_CHUNK_CHARS})" if len(chunk_text) > MAX_CHUNK_CHARS else "")
+        ),
         llm_prompt=prompt,
         llm_raw_response=raw_response,
         parsed_output=parsed,
@@ -174,6 +290,8 @@ def extract_all_chunks(
     model: str = "llama3",
     key_terms: list[str] | None = None,
     max_workers: int = 4,
+    use_cache: bool = True,
+    stream_path: Path | None = None,
 ) -> tuple[list[dict], list[dict]]:
     """Analyse all chunks in parallel.
 
@@ -182,6 +300,11 @@ def extract_all_chunks(
         model:       Ollama model name.
         key_terms:   Optional list of expected concept terms.
         max_workers: Number of parallel threads (default: 4).
+        use_cache:   Reuse cached responses for unchanged chunks (default: True).
+        stream_path: Optional NDJSON file; each analysis is appended as soon as
+                     its chunk finishes ({"index", "part_id", "analysis"} per
+                     line, completion order), so partial progress survives a
+                     crash or interrupt.
 
     Returns:
         (chunk_analyses, thinking_log)
@@ -190,29 +313,44 @@ def extract_all_chunks(
     _is_thinking = any(m in model.lower() for m in ("qwen3", "qwq", "deepseek-r1"))
     llm = ChatOllama(
         model=model, temperature=0.1, num_ctx=num_ctx,
-        **({"format": "json"} if _is_thinking else {}),
+        **({"format": ANALYSIS_SCHEMA} if _is_thinking else {}),
     )
 
     n = len(chunks)
+    max_workers = max(1, max_workers)
     print(f"      Parallel extraction: {n} chunks, max_workers={max_workers}")
 
     results: dict[int, tuple[dict, dict]] = {}
 
     def _run(idx: int, part_id: str, text: str) -> tuple[int, dict, dict]:
-        analysis, step = extract_chunk(text, part_id, llm, key_terms=key_terms)
+        analysis, step = extract_chunk(text, part_id, llm, key_terms=key_terms,
+                                       use_cache=use_cache)
         n_c = len(analysis.get("concepts", []))
         n_a = len(analysis.get("aporias", []))
         print(f"      [{idx+1}/{n}] ✓ {part_id}: {n_c} concepts, {n_a} aporias", flush=True)
         return idx, analysis, step
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(_run, i, part_id, text): i
-            for i, (part_id, text) in enumerate(chunks)
-        }
-        for future in as_completed(futures):
-            idx, analysis, step = future.result()
-            results[idx] = (analysis, step)
+    stream = None
+    if stream_path is not None:
+        stream_path.parent.mkdir(parents=True, exist_ok=True)
+        stream = open(stream_path, "w", encoding="utf-8")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_run, i, part_id, text): i
+                for i, (part_id, text) in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                idx, analysis, step = future.result()
+                results[idx] = (analysis, step)
+                if stream is not None:
+                    record = {"index": idx, "part_id": chunks[idx][0], "analysis": analysis}
+                    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    stream.flush()
+    finally:
+        if stream is not None:
+            stream.close()
 
     # Reassemble in original order
     analyses = [results[i][0] for i in range(n)]
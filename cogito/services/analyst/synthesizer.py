@@ -7,17 +7,27 @@ CogitoState dependency removed; takes plain arguments.
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from typing import Literal
 
 import time
 
 from langchain_ollama import ChatOllama
 
-from cogito.utils.logger import create_step, extract_json
+from cogito.utils.cache import cache_file, read_cached, write_cached
+from cogito.utils.logger import compact_json, create_step, extract_json
 from cogito.utils import event_log
 from cogito.schemas.concept_graph import ConceptGraphV1
 
 
+# Budget for the analyses JSON in the prompt (fits in a 32K token context).
+MAX_ANALYSES_CHARS = 55000
+
+CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "analyst_synthesizer"
+
+# Bump when SYNTHESIS_PROMPT or the compacted analyses format changes.
+CACHE_VERSION = 1
+
 SYNTHESIS_PROMPT = """\
 You are synthesizing multiple chunk-level analyses into a rich, unified concept graph.
 
@@ -108,12 +118,41 @@ Respond ONLY with valid JSON:
 """
 
 
+def _encode_within_budget(analyses_summary: list[dict], budget: int) -> tuple[str, bool]:
+    """Encode chunk summaries as a JSON array of at most `budget` chars.
+
+    Chunks are encoded one at a time and encoding stops at the first chunk
+    that does not fit, so oversized inputs are never serialised in full.
+    Returns (json_text, fits); when fits is False only whole leading chunks
+    are included.
+    """
+    encoded: list[str] = []
+    size = 2  # the enclosing brackets
+    for item in analyses_summary:
+        item_json = compact_json(item)
+        size += len(item_json) + (1 if encoded else 0)
+        if size > budget:
+            return "[" + ",".join(encoded) + "]", False
+        encoded.append(item_json)
+    return "[" + ",".join(encoded) + "]", True
+
+
+def _is_usable_graph(raw_response: str) -> bool:
+    """True if the response parses to a graph with a concepts list."""
+    try:
+        parsed = extract_json(raw_response)
+    except (json.JSONDecodeError, IndexError, ValueError):
+        return False
+    return isinstance(parsed, dict) and isinstance(parsed.get("concepts"), list)
+
+
 def synthesize_concept_graph(
     chunk_analyses: list[dict],
     work_description: str,
     subject: str,
     model: str = "llama3",
     source_mode: Literal["book", "web_researcher"] = "book",
+    use_cache: bool = True,
 ) -> tuple[ConceptGraphV1, list[dict]]:
     """Merge chunk analyses into a unified ConceptGraphV1.
 
@@ -123,6 +162,9 @@ def synthesize_concept_graph(
         subject:          Short identifier stored in the schema (e.g. '方法序説').
         model:            Ollama model name.
         source_mode:      Origin route recorded in the schema.
+        use_cache:        Reuse a previously parsed response for the identical
+                          (model, prompt) instead of calling the LLM. Entries
+                          that no longer parse are dropped and regenerated.
 
     Returns:
         (ConceptGraphV1, thinking_log_entries)
@@ -131,7 +173,8 @@ def synthesize_concept_graph(
     llm = ChatOllama(model=model, temperature=0.1, num_ctx=num_ctx, format="json")
 
     # Build compact representation so ALL chunks fit within the context window.
-    # Full analyses can exceed 90K chars; we distil each to essential fields only.
+    # Full analyses can exceed 90K chars; we distil each to essential fields only,
+    # and serialise without indentation, which only spends context on whitespace.
     analyses_summary = []
     for i, a in enumerate(chunk_analyses):
         compact_concepts = [
@@ -169,17 +212,16 @@ def synthesize_concept_graph(
             "aporias": compact_aporias,
         })
 
-    analyses_json = json.dumps(analyses_summary, ensure_ascii=False, indent=2)
-    # Warn if still large, but allow up to 55000 chars (fits in 32K token context)
-    if len(analyses_json) > 55000:
+    analyses_json, fits = _encode_within_budget(analyses_summary, MAX_ANALYSES_CHARS)
+    if not fits:
         # Last resort: drop quotes and trim descriptions further
         for chunk in analyses_summary:
             for c in chunk.get("concepts", []):
                 c.pop("quote", None)
                 c["description"] = c.get("description", "")[:80]
-        analyses_json = json.dumps(analyses_summary, ensure_ascii=False, indent=2)
-        if len(analyses_json) > 55000:
-            analyses_json = analyses_json[:55000] + "\n... (truncated)"
+        analyses_json, fits = _encode_within_budget(analyses_summary, MAX_ANALYSES_CHARS)
+        if not fits:
+            analyses_json += "\n... (truncated)"
 
     prompt = SYNTHESIS_PROMPT.format(
         chunk_count=len(chunk_analyses),
@@ -187,14 +229,26 @@ def synthesize_concept_graph(
         work_description=work_description,
     )
 
-    _t0 = time.time()
-    raw_response = llm.invoke(prompt).content
-    event_log.llm("analyst/synthesizer", "synthesize_concept_graph", model, time.time() - _t0)
+    # The prompt embeds every compacted chunk analysis, so re-running on
+    # unchanged analyses replays the earlier response.
+    cache_path = cache_file(CACHE_DIR, CACHE_VERSION, model, prompt) if use_cache else None
+    raw_response = (
+        read_cached(cache_path, _is_usable_graph) if cache_path is not None else None
+    )
+    cached = raw_response is not None
+    if cached:
+        event_log.step("analyst/synthesizer", "synthesize_concept_graph: cache hit")
+    else:
+        _t0 = time.time()
+        raw_response = llm.invoke(prompt).content
+        event_log.llm("analyst/synthesizer", "synthesize_concept_graph", model, time.time() - _t0)
 
     parsed: dict | None = None
     error: str | None = None
     try:
         parsed = extract_json(raw_response)
+        if cache_path is not None and not cached and isinstance(parsed.get("concepts"), list):
+            write_cached(cache_path, raw_response)
     except (json.JSONDecodeError, IndexError, ValueError) as e:
         error = f"JSON parse error: {e}"
         parsed = {
@@ -1,61 +1,94 @@
 """Fetch metadata and full text from arxiv papers via API + ar5iv HTML."""
 
+import json
 import re
-import xml.etree.ElementTree as ET
+import threading
+import time
 from pathlib import Path
 
-import httpx
+from lxml import etree
 from lxml import html as lxml_html
 
+from cogito.services.ingestor.adapters.http_client import get_client
+
 DATA_DIR = Path(__file__).parent.parent.parent.parent.parent / "data"
 
 ARXIV_API_URL = "https://export.arxiv.org/api/query"
 AR5IV_HTML_URL = "https://ar5iv.labs.arxiv.org/html"
 
+_VERSION_SUFFIX_RE = re.compile(r"v\d+$")
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
 
-def fetch_arxiv_metadata(arxiv_id: str) -> dict:
-    """Fetch paper metadata from the arxiv Atom API.
+_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
 
-    Returns: {title, authors, abstract, published, categories, pdf_url}
-    """
-    resp = httpx.get(
-        ARXIV_API_URL,
-        params={"id_list": arxiv_id, "max_results": "1"},
-        follow_redirects=True,
-        timeout=30,
-    )
-    resp.raise_for_status()
+# Compiled once; each call only evaluates the expression.
+_XP_ENTRY = etree.XPath("atom:entry", namespaces=_NS)
+_XP_ID = etree.XPath("string(atom:id)", namespaces=_NS)
 
-    ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
-    root = ET.fromstring(resp.text)
-    entry = root.find("atom:entry", ns)
-    if entry is None:
-        raise ValueError(f"No arxiv entry found for ID: {arxiv_id}")
+# Clark-notation tags of the <entry> children _parse_entry reads.
+_ATOM = "{" + _NS["atom"] + "}"
+_TAG_TITLE = _ATOM + "title"
+_TAG_SUMMARY = _ATOM + "summary"
+_TAG_PUBLISHED = _ATOM + "published"
+_TAG_AUTHOR = _ATOM + "author"
+_TAG_NAME = _ATOM + "name"
+_TAG_CATEGORY = _ATOM + "category"
+_TAG_LINK = _ATOM + "link"
 
-    title = entry.findtext("atom:title", "", ns).strip()
-    title = re.sub(r"\s+", " ", title)
+# lxml parsers must not be shared between threads, and ingestion may fetch
+# several papers concurrently, so each thread builds its own once.
+_parser_local = threading.local()
 
-    authors = [
-        a.findtext("atom:name", "", ns).strip()
-        for a in entry.findall("atom:author", ns)
-    ]
 
-    abstract = entry.findtext("atom:summary", "", ns).strip()
-    abstract = re.sub(r"\s+", " ", abstract)
+def _html_parser() -> lxml_html.HTMLParser:
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        # huge_tree lifts libxml2's depth/size limits for very large papers.
+        parser = lxml_html.HTMLParser(
+            recover=True, huge_tree=True, collect_ids=False, remove_blank_text=True,
+        )
+        _parser_local.parser = parser
+    return parser
 
-    published = entry.findtext("atom:published", "", ns)[:10]  # YYYY-MM-DD
 
-    categories = [
-        c.get("term", "")
-        for c in entry.findall("atom:category", ns)
-        if c.get("term")
-    ]
+# ar5iv body candidates, tried in priority order (a single union would pick
+# whichever comes first in the document, i.e. always <body>).
+_XP_BODY_CANDIDATES = (
+    etree.XPath("(.//article)[1]"),
+    etree.XPath("(.//*[@class='ltx_page_content'])[1]"),
+    etree.XPath("(.//body)[1]"),
+)
 
-    pdf_url = ""
-    for link in entry.findall("atom:link", ns):
-        if link.get("title") == "pdf":
-            pdf_url = link.get("href", "")
-            break
+
+def _parse_entry(entry) -> dict:
+    """Turn one Atom <entry> into {title, authors, abstract, published, categories, pdf_url}.
+
+    Reads everything in one sweep over the entry's children.
+    """
+    title = abstract = published = pdf_url = ""
+    authors: list[str] = []
+    categories: list[str] = []
+
+    for child in entry:
+        tag = child.tag
+        if tag == _TAG_TITLE:
+            title = child.text or ""
+        elif tag == _TAG_SUMMARY:
+            abstract = child.text or ""
+        elif tag == _TAG_PUBLISHED:
+            published = (child.text or "")[:10]  # YYYY-MM-DD
+        elif tag == _TAG_AUTHOR:
+            authors.extend(name.text.strip() for name in child.iterchildren(_TAG_NAME) if name.text)
+        elif tag == _TAG_CATEGORY:
+            term = child.get("term")
+            if term:
+                categories.append(term)
+        elif tag == _TAG_LINK and not pdf_url and child.get("title") == "pdf":
+            pdf_url = child.get("href", "")
+
+    # split() with no argument collapses whitespace runs exactly like re.sub(r"\s+", " ").
+    title = " ".join(title.split())
+    abstract = " ".join(abstract.split())
 
     return {
         "title": title,
@@ -67,55 +100,129 @@ def fetch_arxiv_metadata(arxiv_id: str) -> dict:
     }
 
 
+def _short_id(arxiv_id: str) -> str:
+    """'http://arxiv.org/abs/1706.03762v7' or ' 1706.03762v7' → '1706.03762v7'."""
+    return arxiv_id.split("/abs/", 1)[-1].strip()
+
+
+def _bare_id(arxiv_id: str) -> str:
+    """'http://arxiv.org/abs/1706.03762v7' or '1706.03762v7' → '1706.03762'."""
+    return _VERSION_SUFFIX_RE.sub("", _short_id(arxiv_id))
+
+
+def fetch_arxiv_metadata(arxiv_id: str) -> dict:
+    """Fetch paper metadata from the arxiv Atom API.
+
+    Returns: {title, authors, abstract, published, categories, pdf_url}
+    """
+    metadata = fetch_arxiv_metadata_batch([arxiv_id]).get(arxiv_id)
+    if metadata is None:
+        raise ValueError(f"No arxiv entry found for ID: {arxiv_id}")
+    return metadata
+
+
+def fetch_arxiv_metadata_batch(arxiv_ids: list[str], batch_size: int = 100) -> dict[str, dict]:
+    """Fetch metadata for many papers with one API request per batch_size ids.
+
+    A versioned id ('1706.03762v1') matches only that version; an
+    unversioned one matches whichever version the API returns (the latest).
+
+    Returns: {requested_id: metadata} for every id the API returned an entry
+    for; ids without an entry are omitted.
+    """
+    versioned: dict[str, list[str]] = {}
+    unversioned: dict[str, list[str]] = {}
+    for requested in arxiv_ids:
+        short = _short_id(requested)
+        if _VERSION_SUFFIX_RE.search(short):
+            versioned.setdefault(short, []).append(requested)
+        else:
+            unversioned.setdefault(short, []).append(requested)
+
+    results: dict[str, dict] = {}
+    for start in range(0, len(arxiv_ids), batch_size):
+        group = arxiv_ids[start:start + batch_size]
+        resp = get_client().get(
+            ARXIV_API_URL,
+            params={"id_list": ",".join(group), "max_results": str(len(group))},
+            timeout=30,
+        )
+        resp.raise_for_status()
+
+        for entry in _XP_ENTRY(etree.fromstring(resp.content)):
+            entry_id = _short_id(_XP_ID(entry))
+            matches = versioned.get(entry_id, []) + unversioned.get(_bare_id(entry_id), [])
+            if matches:
+                metadata = _parse_entry(entry)
+                for requested in matches:
+                    results[requested] = metadata
+    return results
+
+
+# Block elements that become one markdown line each, with their line template.
+_BLOCK_FORMATS = {
+    "h1": "\n## {}\n",
+    "h2": "\n## {}\n",
+    "h3": "\n### {}\n",
+    "h4": "\n### {}\n",
+    "h5": "\n### {}\n",
+    "p": "{}\n",
+    "figcaption": "[Figure: {}]\n",
+    "caption": "[Table: {}]\n",
+}
+
+
 def _html_to_markdown(tree) -> str:
     """Convert ar5iv HTML body to markdown-like plain text.
 
     Extracts headings, paragraphs, and figure/table captions.
     Math elements are rendered as their text content or alt text.
+    The body is walked once: block text is gathered on the way down, and
+    nested blocks are emitted after their parent, in document order.
     """
     lines: list[str] = []
 
     # Find main article content — ar5iv wraps content in <article> or <div class="ltx_page_content">
-    body = tree.find('.//article')
-    if body is None:
-        body = tree.find('.//*[@class="ltx_page_content"]')
-    if body is None:
-        body = tree.find('.//body')
+    body = None
+    for xpath in _XP_BODY_CANDIDATES:
+        found = xpath(tree)
+        if found:
+            body = found[0]
+            break
     if body is None:
         return ""
 
-    for elem in body.iter():
-        tag = elem.tag
-        text = (elem.text or "").strip()
-        tail = (elem.tail or "").strip()
-
-        if tag in ("h1", "h2"):
-            full = _get_all_text(elem).strip()
-            if full:
-                lines.append(f"\n## {full}\n")
-        elif tag in ("h3", "h4", "h5"):
-            full = _get_all_text(elem).strip()
-            if full:
-                lines.append(f"\n### {full}\n")
-        elif tag == "p":
-            para_text = _get_all_text(elem).strip()
-            if para_text:
-                lines.append(para_text + "\n")
-        elif tag == "figcaption":
-            cap = _get_all_text(elem).strip()
-            if cap:
-                lines.append(f"[Figure: {cap}]\n")
-        elif tag == "caption":
-            cap = _get_all_text(elem).strip()
-            if cap:
-                lines.append(f"[Table: {cap}]\n")
-
+    _walk_blocks(body, lines)
     return "\n".join(lines)
 
 
-def _get_all_text(elem) -> str:
-    """Recursively extract all text from an element, handling math alt text."""
+def _walk_blocks(elem, lines: list[str]) -> None:
+    """Emit a line for every block element below elem that is not inside another block."""
+    for child in elem:
+        if child.tag in _BLOCK_FORMATS:
+            _emit_block(child, lines)
+        else:
+            _walk_blocks(child, lines)
+
+
+def _emit_block(elem, lines: list[str]) -> None:
+    """Append elem's markdown line, then the lines of any blocks nested inside it."""
     parts: list[str] = []
+    nested: list = []
+    _collect_inline(elem, parts, nested)
+    text = " ".join(parts).strip()
+    if text:
+        lines.append(_BLOCK_FORMATS[elem.tag].format(text))
+    for block in nested:
+        _emit_block(block, lines)
+
+
+def _collect_inline(elem, parts: list[str], nested: list) -> None:
+    """Gather elem's inline text into parts, using math alt text where present.
+
+    Nested block elements are not descended into; they are appended to
+    `nested` so the caller can emit them as their own lines.
+    """
     if elem.text:
         parts.append(elem.text)
     for child in elem:
@@ -124,37 +231,80 @@ def _get_all_text(elem) -> str:
             if alt:
                 parts.append(alt)
             else:
-                parts.append(_get_all_text(child))
-        elif child.tag in ("h1", "h2", "h3", "h4", "h5", "p", "figcaption", "caption"):
-            # Skip nested block elements — they'll be processed in top-level iteration
-            pass
+                _collect_inline(child, parts, nested)
+        elif child.tag in _BLOCK_FORMATS:
+            nested.append(child)
         else:
-            parts.append(_get_all_text(child))
+            _collect_inline(child, parts, nested)
         if child.tail:
             parts.append(child.tail)
-    return " ".join(parts)
 
 
-def fetch_arxiv_fulltext(arxiv_id: str, cache_filename: str) -> str:
+def _validators_path(cache_path: Path) -> Path:
+    """Sidecar file holding the HTTP validators for a cached ar5iv page."""
+    return cache_path.with_name(cache_path.name + ".http.json")
+
+
+def _save_validators(cache_path: Path, headers, previous: dict | None = None) -> None:
+    """Store the response's validators; ones it omits are kept from previous.
+
+    A 304 need not repeat ETag / Last-Modified, so dropping the old values
+    would leave nothing to revalidate with next time.
+    """
+    previous = previous or {}
+    validators = {
+        "etag": headers.get("etag") or previous.get("etag", ""),
+        "last_modified": headers.get("last-modified") or previous.get("last_modified", ""),
+        "expires_at": 0.0,
+    }
+    max_age = _MAX_AGE_RE.search(headers.get("cache-control", ""))
+    if max_age:
+        validators["expires_at"] = time.time() + int(max_age.group(1))
+    _validators_path(cache_path).write_text(json.dumps(validators), encoding="utf-8")
+
+
+def fetch_arxiv_fulltext(arxiv_id: str, cache_filename: str, revalidate: bool = False) -> str:
     """Fetch full text from ar5iv HTML, convert to markdown, and cache.
 
     ar5iv provides an HTML5 rendering of arxiv papers.
+
+    With revalidate=True a cached page is checked against the server with a
+    conditional GET (If-None-Match / If-Modified-Since) once its
+    Cache-Control max-age has passed; a 304 reuses the cached markdown
+    without downloading or parsing the page again.
     """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     cache_path = DATA_DIR / cache_filename
+    validators_path = _validators_path(cache_path)
 
+    headers: dict[str, str] = {}
+    validators: dict = {}
     if cache_path.exists():
-        return cache_path.read_text(encoding="utf-8")
+        if not (revalidate and validators_path.exists()):
+            return cache_path.read_text(encoding="utf-8")
+        validators = json.loads(validators_path.read_text(encoding="utf-8"))
+        if time.time() < validators.get("expires_at", 0.0):
+            return cache_path.read_text(encoding="utf-8")
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        if not headers:
+            return cache_path.read_text(encoding="utf-8")
 
     url = f"{AR5IV_HTML_URL}/{arxiv_id}"
-    resp = httpx.get(url, follow_redirects=True, timeout=60)
+    resp = get_client().get(url, headers=headers, timeout=60)
+    if resp.status_code == 304:
+        _save_validators(cache_path, resp.headers, previous=validators)
+        return cache_path.read_text(encoding="utf-8")
     resp.raise_for_status()
 
-    tree = lxml_html.fromstring(resp.content)
+    tree = lxml_html.document_fromstring(resp.content, parser=_html_parser())
     markdown_text = _html_to_markdown(tree)
 
     if not markdown_text.strip():
         raise ValueError(f"No text extracted from ar5iv for {arxiv_id}. The paper may not be available in HTML format.")
 
     cache_path.write_text(markdown_text, encoding="utf-8")
+    _save_validators(cache_path, resp.headers)
     return markdown_text
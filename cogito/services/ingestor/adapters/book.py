@@ -10,14 +10,26 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-import httpx
-
 from cogito.utils.logger import create_step
 from cogito.schemas.chunks import Chunk, ChunksV1
+from cogito.services.ingestor.adapters.http_client import get_client
 
 
 DATA_DIR = Path(__file__).parent.parent.parent.parent.parent / "data"
 
+# ── Precompiled patterns ──────────────────────────────────────────────────────
+
+_GUTENBERG_START_RE = re.compile(r"\*\*\* START OF (?:THE|THIS) PROJECT GUTENBERG EBOOK .+? \*\*\*")
+_GUTENBERG_END_RE   = re.compile(r"\*\*\* END OF (?:THE|THIS) PROJECT GUTENBERG EBOOK .+? \*\*\*")
+_CHAPTER_RE      = re.compile(r"^(Chapter\s+(?:\d+|[IVXLC]+))[\s.:]*", re.MULTILINE)
+_MD_HEADING_RE   = re.compile(r"^(#{1,3}\s+.+)$", re.MULTILINE)
+_CAPS_HEADING_RE = re.compile(r"^([A-Z][A-Z\s]{3,}[A-Z])$", re.MULTILINE)
+_SECTION_RE      = re.compile(r"^(## .+)$", re.MULTILINE)
+_HASH_PREFIX_RE  = re.compile(r"^#+\s*")
+_NON_SLUG_RE     = re.compile(r"[^\w\s-]")
+_HTML_TAG_RE     = re.compile(r"<[^>]+>")
+_WHITESPACE_RE   = re.compile(r"\s+")
+
 
 # ── Text acquisition ─────────────────────────────────────────────────────────
 
@@ -26,7 +38,7 @@ def download_text(url: str, cache_filename: str) -> str:
     cache_path = DATA_DIR / cache_filename
     if cache_path.exists():
         return cache_path.read_text(encoding="utf-8")
-    response = httpx.get(url, follow_redirects=True, timeout=30)
+    response = get_client().get(url, timeout=30)
     response.raise_for_status()
     text = response.text
     cache_path.write_text(text, encoding="utf-8")
@@ -63,12 +75,7 @@ def load_pdf(filepath: str) -> str:
 
 def load_epub(filepath: str) -> str:
     """Load text from an EPUB file."""
-    try:
-        import zipfile
-        from xml.etree import ElementTree as ET
-        import re as _re
-    except ImportError:
-        raise ImportError("Standard library required for EPUB support")
+    import zipfile
 
     path = Path(filepath)
     if not path.is_absolute():
@@ -82,8 +89,8 @@ def load_epub(filepath: str) -> str:
                 try:
                     content = z.read(name).decode('utf-8', errors='ignore')
                     # Strip HTML tags
-                    text = _re.sub(r'<[^>]+>', ' ', content)
-                    text = _re.sub(r'\s+', ' ', text).strip()
+                    text = _HTML_TAG_RE.sub(' ', content)
+                    text = _WHITESPACE_RE.sub(' ', text).strip()
                     if len(text) > 100:
                         texts.append(text)
                 except Exception:
@@ -104,7 +111,7 @@ def acquire_text(source_config: dict) -> str:
         from cogito.services.ingestor.adapters.arxiv_client import fetch_arxiv_fulltext
         arxiv_id = source_config["arxiv_id"]
         cache = cache_filename or f"arxiv_{arxiv_id.replace('/', '_')}.md"
-        return fetch_arxiv_fulltext(arxiv_id, cache)
+        return fetch_arxiv_fulltext(arxiv_id, cache, revalidate=source_config.get("revalidate", False))
     elif source_type == "pdf":
         return load_pdf(source_config.get("path", cache_filename))
     elif source_type == "epub":
@@ -116,10 +123,8 @@ def acquire_text(source_config: dict) -> str:
 # ── Text cleaning ─────────────────────────────────────────────────────────────
 
 def clean_gutenberg(text: str) -> str:
-    start_marker = r"\*\*\* START OF (?:THE|THIS) PROJECT GUTENBERG EBOOK .+? \*\*\*"
-    end_marker   = r"\*\*\* END OF (?:THE|THIS) PROJECT GUTENBERG EBOOK .+? \*\*\*"
-    start_match = re.search(start_marker, text)
-    end_match   = re.search(end_marker, text)
+    start_match = _GUTENBERG_START_RE.search(text)
+    end_match   = _GUTENBERG_END_RE.search(text)
     if start_match:
         text = text[start_match.end():]
     if end_match:
@@ -129,8 +134,10 @@ def clean_gutenberg(text: str) -> str:
 
 # ── Chunking strategies ───────────────────────────────────────────────────────
 
-def chunk_by_regex(text: str, pattern: str) -> list[dict]:
-    splits = list(re.finditer(pattern, text, re.MULTILINE))
+def chunk_by_regex(text: str, pattern: str | re.Pattern) -> list[dict]:
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, re.MULTILINE)
+    splits = list(pattern.finditer(text))
     if not splits:
         return [{"part_id": "full_text", "text": text}]
     chunks = []
@@ -143,19 +150,18 @@ def chunk_by_regex(text: str, pattern: str) -> list[dict]:
 
 
 def chunk_by_chapter(text: str) -> list[dict]:
-    return chunk_by_regex(text, r"^(Chapter\s+(?:\d+|[IVXLC]+))[\s.:]*")
+    return chunk_by_regex(text, _CHAPTER_RE)
 
 
 def chunk_by_heading(text: str) -> list[dict]:
-    md_chunks = chunk_by_regex(text, r"^(#{1,3}\s+.+)$")
+    md_chunks = chunk_by_regex(text, _MD_HEADING_RE)
     if len(md_chunks) > 1:
         return md_chunks
-    return chunk_by_regex(text, r"^([A-Z][A-Z\s]{3,}[A-Z])$")
+    return chunk_by_regex(text, _CAPS_HEADING_RE)
 
 
 def chunk_by_section(text: str, min_chars: int = 200) -> list[dict]:
-    pattern = re.compile(r"^(## .+)$", re.MULTILINE)
-    splits = list(pattern.finditer(text))
+    splits = list(_SECTION_RE.finditer(text))
     if not splits:
         return [{"part_id": "full_text", "text": text}]
     raw_chunks: list[tuple[str, str]] = []
@@ -166,8 +172,8 @@ def chunk_by_section(text: str, min_chars: int = 200) -> list[dict]:
         heading = match.group(1).strip()
         start = match.start()
         end = splits[i + 1].start() if i + 1 < len(splits) else len(text)
-        part_id = re.sub(r"^#+\s*", "", heading)
-        part_id = re.sub(r"[^\w\s-]", "", part_id).strip()[:60]
+        part_id = _HASH_PREFIX_RE.sub("", heading)
+        part_id = _NON_SLUG_RE.sub("", part_id).strip()[:60]
         raw_chunks.append((part_id, text[start:end].strip()))
     merged: list[dict] = []
     carry_id = ""
@@ -195,22 +201,24 @@ def chunk_by_section(text: str, min_chars: int = 200) -> list[dict]:
 def chunk_by_tokens(text: str, max_tokens: int = 2000) -> list[dict]:
     paragraphs = text.split("\n\n")
     chunks: list[dict] = []
-    current_text = ""
+    current_paras: list[str] = []  # joined once per chunk instead of concatenated per paragraph
     current_words = 0
     chunk_idx = 0
     for para in paragraphs:
         para_words = len(para.split())
-        if current_words + para_words > max_tokens and current_text:
+        if current_words + para_words > max_tokens and current_paras:
             chunk_idx += 1
-            chunks.append({"part_id": f"chunk_{chunk_idx}", "text": current_text.strip()})
-            current_text = para
+            chunks.append({"part_id": f"chunk_{chunk_idx}", "text": "\n\n".join(current_paras).strip()})
+            current_paras = [para] if para else []
             current_words = para_words
         else:
-            current_text = current_text + "\n\n" + para if current_text else para
+            if para or current_paras:
+                current_paras.append(para)
             current_words += para_words
-    if current_text.strip():
+    current_text = "\n\n".join(current_paras).strip()
+    if current_text:
         chunk_idx += 1
-        chunks.append({"part_id": f"chunk_{chunk_idx}", "text": current_text.strip()})
+        chunks.append({"part_id": f"chunk_{chunk_idx}", "text": current_text})
     return chunks
 
 
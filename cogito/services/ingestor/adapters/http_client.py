@@ -0,0 +1,34 @@
+"""Shared pooled HTTP client for the ingestor adapters.
+
+One httpx.Client per process keeps TCP/TLS connections alive across
+downloads (Gutenberg, arxiv API, ar5iv) instead of reconnecting per request.
+HTTP/2 is enabled when the optional `h2` package is installed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+
+import httpx
+
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    follow_redirects=True,
+                    timeout=30,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                )
+                atexit.register(_client.close)
+    return _client
@@ -2,9 +2,13 @@
 
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 from langchain_ollama import ChatOllama
 
+from cogito.utils.cache import cache_file, read_cached, write_cached
+
 
 TRANSLATE_PROMPT = """\
 You are a professional English (en) to Japanese (ja) translator. \
@@ -12,17 +16,52 @@ Your goal is to accurately convey the meaning and nuances of the original \
 English text while adhering to Japanese grammar, vocabulary, and cultural \
 sensitivities. This text is about {work_description}. \
 Preserve all technical terms accurately. Keep markdown \
-formatting (headers, bold, lists, quotes) intact.
+formatting (headers, bold, lists, quotes) intact.{batch_note}
 Produce only the Japanese translation, without any additional explanations \
 or commentary. Please translate the following English text into Japanese:
 
 
 {{text}}"""
 
+# Short adjacent sections are translated in one request, separated by this
+# marker, and split apart again afterwards.
+SECTION_BREAK = "<<<SECTION_BREAK>>>"
+_SECTION_JOINER = f"\n\n{SECTION_BREAK}\n\n"
+BATCH_NOTE = (
+    f" The text consists of several parts separated by lines reading "
+    f"{SECTION_BREAK}; copy each such line into the translation unchanged."
+)
+
 # Maximum characters per translation chunk to avoid context overflow.
 # TranslateGemma 12B has limited context; we split long texts.
 MAX_CHUNK_CHARS = 3000
 
+_SECTION_SPLIT_RE = re.compile(r'(^#{2,3} .+$)', re.MULTILINE)
+_SECTION_HEADER_RE = re.compile(r'^#{2,3} ')
+
+# Hiragana, Katakana and CJK Unified Ideographs. Sections where more than
+# this share of non-whitespace characters is Japanese are passed through.
+_JAPANESE_CHAR_RE = re.compile(r'[\u3040-\u30ff\u4e00-\u9fff]')
+_WHITESPACE_RE = re.compile(r'\s+')
+JAPANESE_RATIO_THRESHOLD = 0.3
+
+# Keep the model resident across the section loop (and between files), and
+# cap output so a runaway generation cannot stream up to the context limit.
+# A full MAX_CHUNK_CHARS section translates to well under this many tokens.
+TRANSLATE_KEEP_ALIVE = "30m"
+TRANSLATE_NUM_PREDICT = 4096
+
+# Translated sections are cached so a re-run only translates what changed.
+CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "translator"
+
+# Bump when TRANSLATE_PROMPT or BATCH_NOTE changes.
+CACHE_VERSION = 1
+
+
+def _section_cache_file(model: str, work_description: str, section: str) -> Path:
+    """Return the on-disk cache file for one translated section."""
+    return cache_file(CACHE_DIR, CACHE_VERSION, model, work_description, section, suffix=".md")
+
 
 def _split_by_sections(text: str) -> list[str]:
     """Split markdown text into sections (by ## headers) for chunked translation.
@@ -31,12 +70,12 @@ def _split_by_sections(text: str) -> list[str]:
     Sections exceeding MAX_CHUNK_CHARS are further split by paragraphs.
     """
     # Split by level-2 or level-3 headers
-    parts = re.split(r'(^#{2,3} .+$)', text, flags=re.MULTILINE)
+    parts = _SECTION_SPLIT_RE.split(text)
 
     sections = []
     current = ""
     for part in parts:
-        if re.match(r'^#{2,3} ', part):
+        if _SECTION_HEADER_RE.match(part):
             if current.strip():
                 sections.append(current)
             current = part
@@ -66,38 +105,114 @@ def _split_by_sections(text: str) -> list[str]:
     return result
 
 
+def _is_mostly_japanese(text: str) -> bool:
+    """Return True if the text is already predominantly Japanese."""
+    non_ws = len(text) - sum(len(m) for m in _WHITESPACE_RE.findall(text))
+    japanese = len(_JAPANESE_CHAR_RE.findall(text))
+    return japanese / max(1, non_ws) > JAPANESE_RATIO_THRESHOLD
+
+
+def _group_sections(sections: list[str], indices: list[int]) -> list[list[int]]:
+    """Greedily pack adjacent sections into groups of at most MAX_CHUNK_CHARS."""
+    groups: list[list[int]] = []
+    size = 0
+    for i in indices:
+        length = len(sections[i])
+        if groups and size + len(_SECTION_JOINER) + length <= MAX_CHUNK_CHARS \
+                and groups[-1][-1] == i - 1 and SECTION_BREAK not in sections[i]:
+            groups[-1].append(i)
+            size += len(_SECTION_JOINER) + length
+        else:
+            groups.append([i])
+            size = length
+    return groups
+
+
 def translate_text(text: str, model: str = "translategemma:12b",
-                   work_description: str = "") -> str:
+                   work_description: str = "",
+                   max_workers: int = 4,
+                   use_cache: bool = True) -> str:
     """Translate a full markdown document from English to Japanese.
 
-    Splits into sections, translates each, and reassembles.
+    Splits into sections, packs short neighbours into shared requests,
+    translates up to max_workers requests at once (match OLLAMA_NUM_PARALLEL
+    on the server), and reassembles the sections in document order. With use_cache, sections translated
+    before for the same (model, work_description) are reused.
     """
-    llm = ChatOllama(model=model, temperature=0.1, num_ctx=8192)
-
-    # Build the prompt template with work_description baked in
-    prompt_template = TRANSLATE_PROMPT.format(
+    llm = ChatOllama(model=model, temperature=0.1, num_ctx=8192,
+                     keep_alive=TRANSLATE_KEEP_ALIVE,
+                     num_predict=TRANSLATE_NUM_PREDICT)
+
+    # Bake work_description in once and split around the {text} slot, so
+    # each prompt is a plain concatenation (braces in the description or
+    # the section are never re-parsed as format fields)
+    prompt_prefix, prompt_suffix = TRANSLATE_PROMPT.format(
         work_description=work_description or "an academic work",
-    )
+        batch_note="",
+    ).rsplit("{text}", 1)
+    batch_prefix, batch_suffix = TRANSLATE_PROMPT.format(
+        work_description=work_description or "an academic work",
+        batch_note=BATCH_NOTE,
+    ).rsplit("{text}", 1)
 
     sections = _split_by_sections(text)
-    translated_parts = []
+    translated_parts: list[str] = list(sections)
 
-    for i, section in enumerate(sections):
-        # Skip empty sections or sections that are already mostly Japanese
-        if not section.strip():
-            translated_parts.append(section)
-            continue
+    def _store(section: str, translated: str) -> None:
+        if use_cache and translated:
+            write_cached(_section_cache_file(model, work_description, section), translated)
 
-        prompt = prompt_template.format(text=section)
+    def _translate(section: str) -> str:
+        prompt = prompt_prefix + section + prompt_suffix
         try:
-            result = llm.invoke(prompt).content
-            translated_parts.append(result)
+            translated = llm.invoke(prompt).content.strip()
         except Exception as e:
             # On error, keep original with a note
-            translated_parts.append(f"<!-- 翻訳エラー: {e} -->\n{section}")
-
-        if (i + 1) % 5 == 0:
-            print(f"        [{i+1}/{len(sections)}] sections translated...")
+            return f"<!-- 翻訳エラー: {e} -->\n{section}"
+        _store(section, translated)
+        return translated
+
+    def _translate_group(group: list[int]) -> list[str]:
+        if len(group) == 1:
+            return [_translate(sections[group[0]])]
+        prompt = batch_prefix + _SECTION_JOINER.join(sections[i] for i in group) + batch_suffix
+        try:
+            pieces = [p.strip() for p in llm.invoke(prompt).content.split(SECTION_BREAK)]
+        except Exception:
+            pieces = []
+        if len(pieces) == len(group) and all(pieces):
+            for i, piece in zip(group, pieces):
+                _store(sections[i], piece)
+            return pieces
+        # Marker lost, duplicated or a part left empty: translate the
+        # sections one by one
+        return [_translate(sections[i]) for i in group]
+
+    # Skip empty or already-Japanese sections (kept as-is) and sections
+    # already in the cache
+    pending = []
+    for i, section in enumerate(sections):
+        if not section.strip() or _is_mostly_japanese(section):
+            continue
+        cached = (
+            read_cached(_section_cache_file(model, work_description, section), bool)
+            if use_cache else None
+        )
+        if cached is not None:
+            translated_parts[i] = cached
+        else:
+            pending.append(i)
+    groups = _group_sections(sections, pending)
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(_translate_group, group): group for group in groups}
+        for future in as_completed(futures):
+            group = futures[future]
+            for i, translated in zip(group, future.result()):
+                translated_parts[i] = translated
+            done += len(group)
+            if done % 5 < len(group):
+                print(f"        [{done}/{len(pending)}] sections translated...")
 
     return "\n\n".join(translated_parts)
 
@@ -110,7 +225,11 @@ def translate_node(state: dict) -> dict:
     model = state.get("translator_model", "translategemma:12b")
     work_description = state.get("work_description", "")
 
-    saved = translate_intermediate_outputs(run_dir, model, work_description)
+    saved = translate_intermediate_outputs(
+        run_dir, model, work_description,
+        max_workers=state.get("translate_workers", 4),
+        use_cache=state.get("use_cache", True),
+    )
 
     steps = list(state.get("thinking_log", []))
     steps.append({
@@ -126,6 +245,8 @@ def translate_intermediate_outputs(
     run_dir: "Path",
     model: str = "translategemma:12b",
     work_description: str = "",
+    max_workers: int = 4,
+    use_cache: bool = True,
 ) -> list[str]:
     """Translate all English intermediate .md files to Japanese _ja.md versions.
 
@@ -158,7 +279,8 @@ def translate_intermediate_outputs(
         print(f"      Translating {src_name} -> {dst_name} ({label})...")
         t0 = time.time()
 
-        translated = translate_text(text, model=model, work_description=work_description)
+        translated = translate_text(text, model=model, work_description=work_description,
+                                    max_workers=max_workers, use_cache=use_cache)
 
         elapsed = time.time() - t0
         dst_path.write_text(translated, encoding="utf-8")
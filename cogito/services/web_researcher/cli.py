@@ -42,6 +42,7 @@ def run(
     author: str = "",
     max_results_per_query: int = 4,
     skip_guide: bool = False,
+    use_cache: bool = True,
 ) -> ConceptGraphV1:
     """Programmatic entry point."""
 
@@ -141,6 +142,7 @@ def run(
                 output_path=guide_path,
                 book_config=book_config,
                 model=guide_model,
+                use_cache=use_cache,
             )
             print(f"\n{'='*60}")
             print(f"  Book guide written to {guide_path}")
@@ -178,6 +180,10 @@ def main(argv: list[str] | None = None) -> None:
         "--max-results", type=int, default=4, metavar="N",
         help="Max web results per search query (default: 4)",
     )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore cached book guide parts in data/cache/guide_writer and regenerate them",
+    )
     args = parser.parse_args(argv)
 
     run(
@@ -187,6 +193,7 @@ def main(argv: list[str] | None = None) -> None:
         subject=args.subject,
         author=args.author,
         max_results_per_query=args.max_results,
+        use_cache=not args.no_cache,
     )
 
 
@@ -10,17 +10,25 @@ Output: book_guide.md  (in the same directory as 03_concept_graph.json)
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from langchain_ollama import ChatOllama
 
 from cogito.utils import event_log
+from cogito.utils.cache import cache_file, read_cached, write_cached
 
 from cogito.schemas.concept_graph import ConceptGraphV1
 from cogito.services.web_researcher.aggregator import SynthesizedChunk
 from cogito.services.web_researcher.planner import Heading
 
 
+CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "guide_writer"
+
+# Bump when any of the prompts below changes.
+CACHE_VERSION = 1
+
+
 # ── Prompts ───────────────────────────────────────────────────────────────────
 
 INTRO_PROMPT = """\
@@ -196,6 +204,8 @@ def write_book_guide(
     output_path: Path,
     book_config: dict | None = None,
     model: str = "qwen3-next",
+    max_workers: int = 4,
+    use_cache: bool = True,
 ) -> Path:
     """Generate a detailed book guide (Markdown) from research chunks + concept graph.
 
@@ -206,6 +216,12 @@ def write_book_guide(
         output_path: Where to write the Markdown file.
         book_config: Optional book config for title/author metadata.
         model:       Ollama model (default: qwen3-next for Japanese quality).
+        max_workers: Guide parts generated concurrently. The intro, sections
+                     and checklist are independent prompts; match
+                     OLLAMA_NUM_PARALLEL (default: 4).
+        use_cache:   Reuse parts generated earlier for the identical
+                     (model, prompt), so a retried run only regenerates
+                     what changed.
 
     Returns:
         Path to the written Markdown file.
@@ -229,7 +245,6 @@ def write_book_guide(
     total = len(chunks)
 
     # ── 1. Introduction ────────────────────────────────────────────────────────
-    print(f"  [guide_writer] Writing introduction ...", flush=True)
     headings_list = "\n".join(
         f"  {i+1}. {c.heading_title}"
         for i, c in enumerate(chunks)
@@ -256,21 +271,14 @@ def write_book_guide(
         headings_list=headings_list,
         intro_subtitle=intro_subtitle,
     )
-    _t0 = time.time()
-    intro_md = llm.invoke(intro_prompt).content.strip()
-    event_log.llm("web_researcher/guide_writer", "write_intro", model, time.time() - _t0)
+    jobs: list[tuple[str, str, str]] = [("write_intro", "introduction", intro_prompt)]
 
     # ── 2. Sections (one per chunk) ────────────────────────────────────────────
-    section_parts: list[str] = []
     for i, chunk in enumerate(chunks):
         heading = heading_by_id.get(chunk.heading_id)
         heading_desc = heading.description if heading else chunk.heading_title
         related = _related_text_for_chunk(chunk.heading_id, graph)
 
-        print(
-            f"  [guide_writer] Writing section {i+1}/{total}: {chunk.heading_title} ...",
-            flush=True,
-        )
         section_prompt = SECTION_PROMPT.format(
             book_title_ja=book_title_ja,
             author_ja=author_ja,
@@ -283,13 +291,13 @@ def write_book_guide(
             summary_text=chunk.summary_text[:3000],
             related_text=related,
         )
-        _t0 = time.time()
-        section_md = llm.invoke(section_prompt).content.strip()
-        event_log.llm("web_researcher/guide_writer", f"write_section[{i+1}/{total}]", model, time.time() - _t0)
-        section_parts.append(section_md)
+        jobs.append((
+            f"write_section[{i+1}/{total}]",
+            f"section {i+1}/{total}: {chunk.heading_title}",
+            section_prompt,
+        ))
 
     # ── 3. Practical checklist ─────────────────────────────────────────────────
-    print(f"  [guide_writer] Writing practical checklist ...", flush=True)
     aporias_text = "\n".join(
         f"- [{a.id}] {a.question}"
         for a in graph.aporias
@@ -307,12 +315,35 @@ def write_book_guide(
         concepts_text=concepts_text,
         logic_flow=logic_flow[:800],
     )
-    _t0 = time.time()
-    checklist_md = llm.invoke(checklist_prompt).content.strip()
-    event_log.llm("web_researcher/guide_writer", "write_checklist", model, time.time() - _t0)
+    jobs.append(("write_checklist", "practical checklist", checklist_prompt))
+
+    # ── 4. Generate all parts concurrently, then assemble in order ─────────────
+    def _generate(job: tuple[str, str, str]) -> str:
+        action, label, prompt = job
+        cache_path = (
+            cache_file(CACHE_DIR, CACHE_VERSION, model, prompt, suffix=".md")
+            if use_cache else None
+        )
+        cached = read_cached(cache_path, bool) if cache_path is not None else None
+        if cached is not None:
+            event_log.step("web_researcher/guide_writer", f"{action}: cache hit")
+            return cached
+
+        _t0 = time.time()
+        text = llm.invoke(prompt).content.strip()
+        event_log.llm("web_researcher/guide_writer", action, model, time.time() - _t0)
+        print(f"  [guide_writer] ✓ {label}", flush=True)
+        if cache_path is not None and text:
+            write_cached(cache_path, text)
+        return text
+
+    print(
+        f"  [guide_writer] Writing {len(jobs)} parts ({max_workers} concurrently) ...",
+        flush=True,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parts = list(executor.map(_generate, jobs))
 
-    # ── 4. Assemble and write ──────────────────────────────────────────────────
-    parts = [intro_md] + section_parts + [checklist_md]
     full_guide = "\n\n---\n\n".join(parts)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
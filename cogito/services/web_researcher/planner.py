@@ -54,6 +54,15 @@ _CHAPTER_PATTERNS = [
     ),
 ]
 
+# Helpers applied per title / per match, compiled once here.
+_NON_SLUG_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEP_RE = re.compile(r"[\s-]+")
+_CHAPTER_NUM_RE = re.compile(r"第\s*([0-9]+)\s*章")
+_KANJI_CHAPTER_NUM_RE = re.compile(r"第([一二三四五六七八九十]+)章")
+_CHAPTER_PREFIX_RE = re.compile(r"^第\s*[0-9一二三四五六七八九十百]+\s*章[\s　]+")
+_PAREN_TAIL_RE = re.compile(r"[（(（].*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 DESCRIPTION_ENRICH_PROMPT = """\
 The following are chapter titles extracted from web search results about the book
 "{title}" by {author}.
@@ -105,8 +114,8 @@ def _slugify(text) -> str:
     """Convert a title to a snake_case slug."""
     text = str(text)
     text = unicodedata.normalize("NFKC", text.lower())
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s-]+", "_", text.strip())
+    text = _NON_SLUG_RE.sub("", text)
+    text = _SLUG_SEP_RE.sub("_", text.strip())
     return text[:60] or "heading"
 
 
@@ -133,10 +142,10 @@ _KANJI_DIGIT = {
 
 def _parse_chapter_num(raw: str) -> int | None:
     """Return the Arabic integer chapter number from a 第N章 string, or None."""
-    m = re.match(r"第\s*([0-9]+)\s*章", raw)
+    m = _CHAPTER_NUM_RE.match(raw)
     if m:
         return int(m.group(1))
-    m = re.match(r"第([一二三四五六七八九十]+)章", raw)
+    m = _KANJI_CHAPTER_NUM_RE.match(raw)
     if m:
         return _KANJI_DIGIT.get(m.group(1))
     return None
@@ -166,9 +175,9 @@ def _extract_chapters_regex(raw_results: list[dict]) -> list[str]:
             continue
 
         # Extract the title portion (everything after 章 and its whitespace)
-        after = re.sub(r"^第\s*[0-9一二三四五六七八九十百]+\s*章[\s　]+", "", raw).strip()
+        after = _CHAPTER_PREFIX_RE.sub("", raw).strip()
         # Strip parenthetical sub-items like (勉強とは… ほか). or （…）
-        clean = re.sub(r"[（(（].*", "", after).strip().rstrip(".")
+        clean = _PAREN_TAIL_RE.sub("", after).strip().rstrip(".")
         clean_title = f"第{num}章 {clean}".strip() if clean else f"第{num}章"
 
         existing = by_chapter.get(num, "")
@@ -184,7 +193,7 @@ def _extract_chapters_regex(raw_results: list[dict]) -> list[str]:
             marker = m.group(1).strip()
             subtitle = (m.group(2) or "").strip()
             title = f"{marker}　{subtitle}".strip() if subtitle else marker
-            key = re.sub(r"\s+", " ", title)
+            key = _WHITESPACE_RE.sub(" ", title)
             if key and key not in seen:
                 seen.add(key)
                 found.insert(0, key)  # prefix sections go first
@@ -194,7 +203,7 @@ def _extract_chapters_regex(raw_results: list[dict]) -> list[str]:
         seen = set()
         for m in _CHAPTER_PATTERNS[2].finditer(full_text):
             title = f"Chapter {m.group(1)}: {m.group(2).strip()}"
-            key = re.sub(r"\s+", " ", title)
+            key = _WHITESPACE_RE.sub(" ", title)
             if key and key not in seen:
                 seen.add(key)
                 found.append(key)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 
 import time
 
@@ -47,13 +48,23 @@ Respond ONLY with valid JSON:
 """
 
 
+@lru_cache(maxsize=None)
+def _query_llm(model: str) -> ChatOllama:
+    """Shared query-generation client per model.
+
+    generate_queries runs once per heading, and each ChatOllama builds its
+    own pair of httpx clients (~40 ms of SSL setup) and connection pool.
+    """
+    return ChatOllama(model=model, temperature=0.3, num_ctx=8192, format="json")
+
+
 def generate_queries(
     subject: str,
     heading: Heading,
     model: str = "llama3",
 ) -> list[str]:
     """Generate targeted search queries for a single heading."""
-    llm = ChatOllama(model=model, temperature=0.3, num_ctx=8192, format="json")
+    llm = _query_llm(model)
     prompt = QUERY_GEN_PROMPT.format(
         subject=subject,
         heading_title=heading.title,
@@ -101,6 +112,17 @@ def search_headings(
 
         # Execute searches
         raw_results = search_batch(queries, max_results=max_results_per_query)
+
+        # Related queries often return the same page; keep its first hit only
+        seen_urls: set[str] = set()
+        unique_results = []
+        for r in raw_results:
+            if r["url"] and r["url"] in seen_urls:
+                continue
+            seen_urls.add(r["url"])
+            unique_results.append(r)
+        duplicates = len(raw_results) - len(unique_results)
+
         results = [
             SearchResult(
                 query=r["query"],
@@ -108,7 +130,7 @@ def search_headings(
                 url=r["url"],
                 body=r["body"],
             )
-            for r in raw_results
+            for r in unique_results
         ]
 
         results_by_heading[heading.id] = results
@@ -124,7 +146,10 @@ def search_headings(
                 "result_count": len(results),
                 "sources": [r.url for r in results[:5]],
             },
-            reasoning=f"Found {len(results)} results for '{heading.title}'",
+            reasoning=(
+                f"Found {len(results)} results for '{heading.title}'"
+                f" ({duplicates} duplicate URLs dropped)"
+            ),
         ))
 
     return results_by_heading, log
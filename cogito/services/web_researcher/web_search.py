@@ -14,11 +14,56 @@ Usage:
     python3 -m cogito.services.web_researcher.web_search "auto select query"
 """
 
+import importlib.util
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from cogito.utils import event_log
 
+# Tavily is a paid API without a per-second limit; a small pool overlaps the
+# round trips while staying polite. DuckDuckGo is unauthenticated and
+# rate-limits bursts, so it stays sequential with a pause between queries.
+TAVILY_MAX_WORKERS = 3
+DDG_DELAY_SECONDS = 1.5
+
+# Reused across calls so the HTTPS keep-alive pool survives between batches;
+# rebuilt whenever TAVILY_API_KEY changes.
+_tavily_client = None
+_tavily_api_key: str | None = None
+
+
+def _get_tavily_client(client_cls, api_key: str):
+    """Return the shared Tavily client, creating it on first use or key change."""
+    global _tavily_client, _tavily_api_key
+    if _tavily_client is None or api_key != _tavily_api_key:
+        _tavily_client = client_cls(api_key=api_key)
+        _tavily_api_key = api_key
+    return _tavily_client
+
+
+def _tavily_query(client, query: str, max_results: int) -> list[dict]:
+    """Run one Tavily query; failures are logged and yield no results."""
+    t0 = time.time()
+    try:
+        response = client.search(query=query, max_results=max_results)
+    except Exception as e:
+        print(f"      [tavily] Query failed: '{query}': {e}")
+        event_log.error("web_researcher/web_search", f"tavily failed: {e}")
+        return []
+    hits = response.get("results", [])
+    event_log.api("web_researcher/web_search", "tavily", query, len(hits), time.time() - t0)
+    return [
+        {
+            "query": query,
+            "title": r.get("title", ""),
+            "url": r.get("url", ""),
+            "body": r.get("content", ""),
+        }
+        for r in hits
+    ]
+
 
 def search_tavily(queries: list[str], max_results: int = 5) -> list[dict]:
     """Search via Tavily API. Requires TAVILY_API_KEY environment variable.
@@ -35,30 +80,36 @@ def search_tavily(queries: list[str], max_results: int = 5) -> list[dict]:
     except ImportError:
         raise RuntimeError("tavily-python is not installed. Run: pip install tavily-python")
 
-    client = TavilyClient(api_key=api_key)
-    all_results = []
+    client = _get_tavily_client(TavilyClient, api_key)
+    if not queries:
+        return []
 
-    for i, query in enumerate(queries):
-        t0 = time.time()
-        try:
-            response = client.search(query=query, max_results=max_results)
-            hits = response.get("results", [])
-            for r in hits:
-                all_results.append({
-                    "query": query,
-                    "title": r.get("title", ""),
-                    "url": r.get("url", ""),
-                    "body": r.get("content", ""),
-                })
-            event_log.api("web_researcher/web_search", "tavily", query, len(hits), time.time() - t0)
-        except Exception as e:
-            print(f"      [tavily] Query failed: '{query}': {e}")
-            event_log.error("web_researcher/web_search", f"tavily failed: {e}")
-
-        if i < len(queries) - 1:
-            time.sleep(0.5)
+    # Queries run concurrently; results keep the order of `queries`.
+    with ThreadPoolExecutor(max_workers=min(TAVILY_MAX_WORKERS, len(queries))) as executor:
+        per_query = list(executor.map(lambda q: _tavily_query(client, q, max_results), queries))
 
-    return all_results
+    return [r for hits in per_query for r in hits]
+
+
+def _ddg_query(ddgs, query: str, max_results: int) -> list[dict]:
+    """Run one DuckDuckGo query; failures are logged and yield no results."""
+    t0 = time.time()
+    try:
+        results = list(ddgs.text(query, max_results=max_results))
+    except Exception as e:
+        print(f"      [duckduckgo] Query failed: '{query}': {e}")
+        event_log.error("web_researcher/web_search", f"duckduckgo failed: {e}")
+        return []
+    event_log.api("web_researcher/web_search", "duckduckgo", query, len(results), time.time() - t0)
+    return [
+        {
+            "query": query,
+            "title": r.get("title", ""),
+            "url": r.get("href", ""),
+            "body": r.get("body", ""),
+        }
+        for r in results
+    ]
 
 
 def search_duckduckgo(queries: list[str], max_results: int = 5) -> list[dict]:
@@ -78,48 +129,33 @@ def search_duckduckgo(queries: list[str], max_results: int = 5) -> list[dict]:
                 "Run: pip install ddgs"
             )
 
+    if not queries:
+        return []
+
+    # One session serves the whole batch, reusing its connection
     all_results = []
-    for i, query in enumerate(queries):
-        t0 = time.time()
-        try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=max_results))
-            for r in results:
-                all_results.append({
-                    "query": query,
-                    "title": r.get("title", ""),
-                    "url": r.get("href", ""),
-                    "body": r.get("body", ""),
-                })
-            event_log.api("web_researcher/web_search", "duckduckgo", query, len(results), time.time() - t0)
-        except Exception as e:
-            print(f"      [duckduckgo] Query failed: '{query}': {e}")
-            event_log.error("web_researcher/web_search", f"duckduckgo failed: {e}")
-
-        if i < len(queries) - 1:
-            time.sleep(1.5)
+    with DDGS() as ddgs:
+        for i, query in enumerate(queries):
+            all_results.extend(_ddg_query(ddgs, query, max_results))
+
+            if i < len(queries) - 1:
+                time.sleep(DDG_DELAY_SECONDS)
 
     return all_results
 
 
+@lru_cache(maxsize=None)
+def _is_installed(module: str) -> bool:
+    """Return True if the module can be found, without importing it."""
+    return importlib.util.find_spec(module) is not None
+
+
 def get_available_engine() -> str | None:
     """Return the best available search engine name, or None."""
-    if os.environ.get("TAVILY_API_KEY"):
-        try:
-            import tavily  # noqa: F401
-            return "tavily"
-        except ImportError:
-            pass
-    # Try ddgs
-    try:
-        import ddgs  # noqa: F401
+    if os.environ.get("TAVILY_API_KEY") and _is_installed("tavily"):
+        return "tavily"
+    if _is_installed("ddgs") or _is_installed("duckduckgo_search"):
         return "duckduckgo"
-    except ImportError:
-        try:
-            import duckduckgo_search  # noqa: F401
-            return "duckduckgo"
-        except ImportError:
-            pass
     return None
 
 
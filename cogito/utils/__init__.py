@@ -1,4 +1,20 @@
-"""Shared utilities: logging, JSON extraction."""
-from cogito.utils.logger import create_step, extract_json, flush_log, make_run_id
+"""Shared utilities: logging, JSON extraction, LLM response caching."""
+from cogito.utils.cache import cache_file, read_cached, write_cached
+from cogito.utils.logger import (
+    compact_json,
+    create_step,
+    extract_json,
+    flush_log,
+    make_run_id,
+)
 
-__all__ = ["create_step", "extract_json", "flush_log", "make_run_id"]
+__all__ = [
+    "cache_file",
+    "compact_json",
+    "create_step",
+    "extract_json",
+    "flush_log",
+    "make_run_id",
+    "read_cached",
+    "write_cached",
+]
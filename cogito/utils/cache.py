@@ -0,0 +1,52 @@
+"""On-disk cache for LLM responses.
+
+Each service keeps its own directory under data/cache/<service>/ and its own
+CACHE_VERSION; bumping the version changes every key, so responses produced
+for an older prompt are never replayed. Files are keyed by the sha256 of the
+version plus everything the call depends on (typically model and prompt).
+"""
+
+import hashlib
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+
+def cache_file(cache_dir: Path, version: int, *parts: str, suffix: str = ".txt") -> Path:
+    """Return the cache file for a call identified by parts (e.g. model, prompt)."""
+    key = hashlib.sha256(
+        "\0".join([str(version), *parts]).encode("utf-8")
+    ).hexdigest()
+    return cache_dir / f"{key}{suffix}"
+
+
+def read_cached(path: Path, is_valid: Callable[[str], bool] | None = None) -> str | None:
+    """Return the cached text, or None on a miss.
+
+    An entry that cannot be decoded or that is_valid rejects (e.g. a
+    response that no longer parses) is deleted and reported as a miss, so
+    the caller regenerates it instead of replaying it on every run.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError):
+        text = None
+    if text is None or (is_valid is not None and not is_valid(text)):
+        path.unlink(missing_ok=True)
+        return None
+    return text
+
+
+def write_cached(path: Path, text: str) -> None:
+    """Write a cache entry atomically, so readers never see a torn file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -1,15 +1,52 @@
 """Thinking log system for traceability across the pipeline."""
 
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 LOGS_DIR = Path(__file__).parent.parent.parent / "logs"
 
 
+def _loads(text: str):
+    """json.loads, via orjson when available (raises json.JSONDecodeError either way).
+
+    orjson is stricter than json (e.g. it rejects NaN and Infinity), so
+    anything it refuses is retried with json before giving up.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def compact_json(obj) -> str:
+    """Serialise obj without whitespace or ASCII escaping (orjson when available).
+
+    Used for JSON embedded in LLM prompts, where indentation only costs context.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:  # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# <think>...</think> blocks emitted by reasoning models (qwen3.5, deepseek-r1)
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+
 class ThinkingStep(BaseModel):
     timestamp: str = ""
     layer: str = ""  # "reader" | "director" | "dramaturg" | "audio"
@@ -75,13 +112,14 @@ def extract_json(text: str) -> dict:
     4. First { to last } (bare JSON with text preamble)
     """
     # Strip thinking blocks from reasoning models (e.g. qwen3.5, deepseek-r1)
-    import re
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    if "<think>" in text:
+        text = _THINK_RE.sub("", text)
+    text = text.strip()
 
     # Try code fences first
     if "```json" in text:
         json_text = text.split("```json")[1].split("```")[0]
-        return json.loads(json_text.strip())
+        return _loads(json_text.strip())
     if "```" in text:
         parts = text.split("```")
         if len(parts) >= 3:
@@ -89,13 +127,13 @@ def extract_json(text: str) -> dict:
             # Strip optional language tag on first line
             if json_text.startswith(("json", "JSON")):
                 json_text = json_text[4:]
-            return json.loads(json_text.strip())
+            return _loads(json_text.strip())
 
     # Fallback: find outermost { ... }
     first_brace = text.find("{")
     last_brace = text.rfind("}")
     if first_brace != -1 and last_brace > first_brace:
-        return json.loads(text[first_brace:last_brace + 1])
+        return _loads(text[first_brace:last_brace + 1])
 
     raise json.JSONDecodeError("No JSON object found in response", text, 0)
 
@@ -123,5 +161,12 @@ def flush_log(
     )
 
     path = LOGS_DIR / f"{run_id}.json"
-    path.write_text(json.dumps(log.model_dump(), ensure_ascii=False, indent=2))
+    data = log.model_dump()
+    if orjson is not None:
+        try:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return path
+        except TypeError:  # e.g. integers wider than 64 bits in parsed_output
+            pass
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     return path
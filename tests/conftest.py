@@ -8,6 +8,7 @@ Usage:
 import json
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -119,6 +120,45 @@ SAMPLE_PERSONA = {
 }
 
 
+# ── Fake LLM (no Ollama required) ─────────────────────────────────────────────
+
+class FakeLLM:
+    """Stand-in for ChatOllama that returns canned replies and records prompts.
+
+    reply is a fixed string, a list of strings returned in turn, or a
+    callable mapping the prompt to a string. Calling the instance returns
+    itself, so it can also replace the ChatOllama class in a module.
+    """
+
+    def __init__(self, reply, model: str = "fake") -> None:
+        self.model = model
+        self.prompts: list[str] = []
+        self._reply = reply
+
+    @property
+    def calls(self) -> int:
+        return len(self.prompts)
+
+    def __call__(self, **kwargs) -> "FakeLLM":
+        return self
+
+    def invoke(self, prompt: str) -> SimpleNamespace:
+        self.prompts.append(prompt)
+        if callable(self._reply):
+            content = self._reply(prompt)
+        elif isinstance(self._reply, list):
+            content = self._reply.pop(0)
+        else:
+            content = self._reply
+        return SimpleNamespace(content=content)
+
+
+@pytest.fixture
+def fake_llm():
+    """Factory fixture: fake_llm(reply) -> FakeLLM."""
+    return FakeLLM
+
+
 @pytest.fixture
 def model() -> str:
     return DEFAULT_MODEL
@@ -38,6 +38,103 @@ class TestAnalystUnit:
         restored = ConceptGraphV1.model_validate_json(graph.model_dump_json())
         assert len(graph.concepts) == len(restored.concepts)
 
+    def test_key_terms_filtered_only_for_long_lists(self) -> None:
+        from cogito.services.analyst.extractor import (
+            KEY_TERMS_FILTER_THRESHOLD,
+            _key_terms_for_chunk,
+        )
+
+        text = "Multi-Head Attention extends scaled dot-product attention."
+        short = ["Methodical Doubt", "Cogito ergo sum"]
+        assert _key_terms_for_chunk(text, short) == short
+
+        long_terms = ["Multi-Head Attention", "Scaled Dot-Product Attention"] + [
+            f"unused term {i}" for i in range(KEY_TERMS_FILTER_THRESHOLD)
+        ]
+        assert _key_terms_for_chunk(text, long_terms) == [
+            "Multi-Head Attention", "Scaled Dot-Product Attention",
+        ]
+
+        # Terms nested inside a longer matching term are kept too
+        nested = ["Attention", "Multi-Head Attention", "Head"] + long_terms[2:]
+        assert _key_terms_for_chunk("Multi-Head Attention", nested) == [
+            "Attention", "Multi-Head Attention", "Head",
+        ]
+
+    def test_extract_chunk_reuses_cached_response(
+        self, tmp_path, monkeypatch, fake_llm, sample_chunk_analysis: dict
+    ) -> None:
+        import json
+
+        from cogito.services.analyst import extractor
+
+        llm = fake_llm(json.dumps(sample_chunk_analysis))
+        monkeypatch.setattr(extractor, "CACHE_DIR", tmp_path / "cache")
+        first, _ = extractor.extract_chunk("text", "PART_I", llm)
+        second, _ = extractor.extract_chunk("text", "PART_I", llm)
+
+        assert llm.calls == 1
+        assert first == second
+
+    def test_extract_chunk_replaces_bad_cache_entries(
+        self, tmp_path, monkeypatch, fake_llm, sample_chunk_analysis: dict
+    ) -> None:
+        import json
+
+        from cogito.services.analyst import extractor
+
+        llm = fake_llm(["{}"] + [json.dumps(sample_chunk_analysis)] * 2)
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(extractor, "CACHE_DIR", cache_dir)
+
+        # A parseable but empty response is not cached
+        extractor.extract_chunk("text", "PART_I", llm)
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+        extractor.extract_chunk("text", "PART_I", llm)
+        (entry,) = cache_dir.iterdir()
+
+        # A torn entry is discarded and regenerated rather than replayed
+        entry.write_text(entry.read_text(encoding="utf-8")[:20], encoding="utf-8")
+        analysis, step = extractor.extract_chunk("text", "PART_I", llm)
+        assert step["error"] is None
+        assert analysis["concepts"] == sample_chunk_analysis["concepts"]
+        assert llm.calls == 3
+
+        extractor.extract_chunk("text", "PART_I", llm)
+        assert llm.calls == 3
+
+    def test_analyses_payload_respects_budget(self) -> None:
+        import json
+
+        from cogito.services.analyst.synthesizer import _encode_within_budget
+
+        summary = [{"chunk": i, "logic": "x" * 50} for i in range(10)]
+
+        text, fits = _encode_within_budget(summary, budget=10_000)
+        assert fits and json.loads(text) == summary
+
+        text, fits = _encode_within_budget(summary, budget=200)
+        assert not fits and len(text) <= 200
+        assert json.loads(text) == summary[: len(json.loads(text))]
+
+    def test_synthesize_reuses_cached_response(
+        self, tmp_path, monkeypatch, fake_llm, sample_chunk_analysis: dict
+    ) -> None:
+        import json
+
+        from cogito.services.analyst import synthesizer
+
+        llm = fake_llm(json.dumps(sample_chunk_analysis))
+        monkeypatch.setattr(synthesizer, "ChatOllama", llm)
+        monkeypatch.setattr(synthesizer, "CACHE_DIR", tmp_path / "cache")
+        kwargs = dict(work_description="Test", subject="Test", model="fake")
+        first, _ = synthesizer.synthesize_concept_graph([sample_chunk_analysis], **kwargs)
+        second, _ = synthesizer.synthesize_concept_graph([sample_chunk_analysis], **kwargs)
+
+        assert llm.calls == 1
+        assert first.model_dump() == second.model_dump()
+
 
 # ── Integration: real LLM calls ───────────────────────────────────────────────
 
@@ -64,3 +64,97 @@ class TestIngestorLocalFile:
         }
         chunks_v1, _ = ingest_from_book_config(book_config)
         assert len(chunks_v1.chunks) >= 1
+
+
+# ── Unit: ar5iv conditional GET ───────────────────────────────────────────────
+
+class TestArxivRevalidation:
+    def test_304_without_validators_keeps_stored_ones(self, tmp_path: Path, monkeypatch) -> None:
+        from types import SimpleNamespace
+
+        from cogito.services.ingestor.adapters import arxiv_client
+
+        def page(text: str) -> bytes:
+            return f"<html><body><article><p>{text}</p></article></body></html>".encode()
+
+        responses = [
+            SimpleNamespace(status_code=200, content=page("Version one"),
+                            headers={"etag": '"v1"', "cache-control": "max-age=0"}),
+            SimpleNamespace(status_code=304, content=b"", headers={}),
+            SimpleNamespace(status_code=200, content=page("Version two"),
+                            headers={"etag": '"v2"'}),
+        ]
+        sent_headers: list[dict] = []
+
+        class FakeClient:
+            def get(self, url, headers=None, timeout=None):
+                sent_headers.append(dict(headers or {}))
+                resp = responses.pop(0)
+                resp.raise_for_status = lambda: None
+                return resp
+
+        monkeypatch.setattr(arxiv_client, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(arxiv_client, "get_client", lambda: FakeClient())
+
+        first = arxiv_client.fetch_arxiv_fulltext("1234.5678", "paper.md", revalidate=True)
+        second = arxiv_client.fetch_arxiv_fulltext("1234.5678", "paper.md", revalidate=True)
+        third = arxiv_client.fetch_arxiv_fulltext("1234.5678", "paper.md", revalidate=True)
+
+        assert "Version one" in first and second == first
+        assert "Version two" in third
+        assert sent_headers == [{}, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+
+
+# ── Unit: arxiv Atom API ──────────────────────────────────────────────────────
+
+_ATOM_FEED = """\
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/1706.03762v1</id>
+    <title>Attention Is
+      All You Need</title>
+    <summary> First version. </summary>
+    <published>2017-06-12T17:57:34Z</published>
+    <author><name>Ashish Vaswani</name></author>
+    <category term="cs.CL"/>
+    <link title="pdf" href="http://arxiv.org/pdf/1706.03762v1"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/1706.03762v7</id>
+    <title>Attention Is All You Need</title>
+    <summary>Latest version.</summary>
+    <published>2017-06-12T17:57:34Z</published>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/hep-th/9901001v2</id>
+    <title>An old-style id</title>
+    <summary>Old.</summary>
+    <published>1999-01-01T00:00:00Z</published>
+  </entry>
+</feed>
+"""
+
+
+class TestArxivMetadataBatch:
+    def test_ids_map_to_their_own_entries(self, monkeypatch) -> None:
+        from types import SimpleNamespace
+
+        from cogito.services.ingestor.adapters import arxiv_client
+
+        class FakeClient:
+            def get(self, url, params=None, timeout=None):
+                return SimpleNamespace(content=_ATOM_FEED.encode(), raise_for_status=lambda: None)
+
+        monkeypatch.setattr(arxiv_client, "get_client", lambda: FakeClient())
+        requested = ["1706.03762v1", "1706.03762v7", "hep-th/9901001", "2101.00001"]
+
+        results = arxiv_client.fetch_arxiv_metadata_batch(requested)
+
+        assert set(results) == {"1706.03762v1", "1706.03762v7", "hep-th/9901001"}
+        assert results["1706.03762v1"]["abstract"] == "First version."
+        assert results["1706.03762v1"]["title"] == "Attention Is All You Need"
+        assert results["1706.03762v1"]["authors"] == ["Ashish Vaswani"]
+        assert results["1706.03762v1"]["categories"] == ["cs.CL"]
+        assert results["1706.03762v1"]["pdf_url"] == "http://arxiv.org/pdf/1706.03762v1"
+        assert results["1706.03762v7"]["abstract"] == "Latest version."
+        assert results["hep-th/9901001"]["published"] == "1999-01-01"
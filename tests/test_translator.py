@@ -0,0 +1,95 @@
+"""Translator service tests.
+
+Unit tests only: ChatOllama is replaced by the fake_llm fixture, so no
+Ollama server is needed.
+"""
+
+import pytest
+
+from cogito.services.translator import translator
+
+
+def _body(prompt: str) -> str:
+    """Return the text a translation prompt asks to translate."""
+    return prompt.rsplit("into Japanese:\n\n\n", 1)[1]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(translator, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+# ── Unit: section batching ────────────────────────────────────────────────────
+
+class TestTranslatorUnit:
+    def test_short_sections_share_one_request(self, monkeypatch, fake_llm, cache_dir) -> None:
+        llm = fake_llm(lambda prompt: _body(prompt).upper())
+        monkeypatch.setattr(translator, "ChatOllama", llm)
+
+        out = translator.translate_text("## A\nalpha\n\n## B\nbeta", use_cache=False)
+
+        assert llm.calls == 1
+        assert translator.SECTION_BREAK in llm.prompts[0]
+        assert translator.BATCH_NOTE in llm.prompts[0]
+        assert out == "## A\nALPHA\n\n## B\nBETA"
+
+    @pytest.mark.parametrize("reply", [
+        "merged without a marker",
+        "a <<<SECTION_BREAK>>> b <<<SECTION_BREAK>>> c",
+    ])
+    def test_marker_count_mismatch_falls_back_per_section(
+        self, monkeypatch, fake_llm, cache_dir, reply: str
+    ) -> None:
+        def respond(prompt: str) -> str:
+            return reply if translator.SECTION_BREAK in prompt else _body(prompt).upper()
+
+        llm = fake_llm(respond)
+        monkeypatch.setattr(translator, "ChatOllama", llm)
+
+        out = translator.translate_text("## A\nalpha\n\n## B\nbeta", use_cache=False)
+
+        assert llm.calls == 3  # the batch, then one call per section
+        assert out == "## A\nALPHA\n\n## B\nBETA"
+
+    def test_empty_batch_piece_falls_back_per_section(
+        self, monkeypatch, fake_llm, cache_dir
+    ) -> None:
+        def respond(prompt: str) -> str:
+            if translator.SECTION_BREAK in prompt:
+                return f"Aの訳\n{translator.SECTION_BREAK}\n"
+            return _body(prompt).upper()
+
+        llm = fake_llm(respond)
+        monkeypatch.setattr(translator, "ChatOllama", llm)
+
+        out = translator.translate_text("## A\nalpha\n\n## B\nbeta")
+        again = translator.translate_text("## A\nalpha\n\n## B\nbeta")
+
+        assert llm.calls == 3  # the batch, then one call per section
+        assert out == again == "## A\nALPHA\n\n## B\nBETA"
+
+    def test_japanese_section_passes_through(self, monkeypatch, fake_llm, cache_dir) -> None:
+        llm = fake_llm(lambda prompt: _body(prompt).upper())
+        monkeypatch.setattr(translator, "ChatOllama", llm)
+        japanese = "## 方法序説\n良識はこの世で最も公平に分け与えられているものである。"
+
+        out = translator.translate_text(japanese, use_cache=False)
+
+        assert llm.calls == 0
+        assert out == japanese
+        assert translator._is_mostly_japanese(japanese)
+        assert not translator._is_mostly_japanese("## Cogito\nI think (我思う), therefore I am.")
+
+    def test_cached_sections_skip_the_llm(self, monkeypatch, fake_llm, cache_dir) -> None:
+        llm = fake_llm(lambda prompt: _body(prompt).upper())
+        monkeypatch.setattr(translator, "ChatOllama", llm)
+        text = "## A\nalpha\n\n## B\nbeta"
+
+        first = translator.translate_text(text)
+        second = translator.translate_text(text)
+        changed = translator.translate_text(text.replace("beta", "gamma"))
+
+        assert first == second
+        assert llm.calls == 2  # first run batched, then only the changed section
+        assert changed == "## A\nALPHA\n\n## B\nGAMMA"
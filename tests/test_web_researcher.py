@@ -46,6 +46,26 @@ class TestWebResearcherUnit:
         assert graph.source_mode == "web_researcher"
         assert graph.generated_by == "web_researcher"
 
+    def test_book_guide_reuses_cached_parts(
+        self, tmp_path, monkeypatch, fake_llm, concept_graph_v1: ConceptGraphV1
+    ) -> None:
+        from cogito.services.web_researcher import guide_writer
+
+        llm = fake_llm(lambda prompt: f"part {len(prompt)}")
+        monkeypatch.setattr(guide_writer, "_llm", lambda model: llm)
+        monkeypatch.setattr(guide_writer, "CACHE_DIR", tmp_path / "cache")
+        chunks = [
+            SynthesizedChunk(heading_id=f"h{i}", heading_title=f"Heading {i}", summary_text="...")
+            for i in range(3)
+        ]
+        headings = [Heading(id=c.heading_id, title=c.heading_title) for c in chunks]
+
+        first = guide_writer.write_book_guide(chunks, headings, concept_graph_v1, tmp_path / "a.md")
+        second = guide_writer.write_book_guide(chunks, headings, concept_graph_v1, tmp_path / "b.md")
+
+        assert llm.calls == len(chunks) + 2  # intro + sections + checklist, once
+        assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+
 
 # ── Integration: LLM (no real web search) ─────────────────────────────────────
 